@@ -1,5 +1,6 @@
 # stdlib
 from io import StringIO
+from typing import Dict
 from unittest.mock import patch
 # lib
 from django.core.management import call_command
@@ -7,17 +8,50 @@ from django.urls import reverse
 from rest_framework import status
 # local
 from api import notifier
-from api.models import BISList, Character, Gear, Notification, Job, Settings, Team, Tier
+from api.models import BISList, Character, Gear, Notification, Settings, Team, TeamMember, Tier
 from api.serializers import CharacterCollectionSerializer, CharacterDetailsSerializer
 from .test_base import SavageAimTestCase
 
+COLLECTION_URL = reverse('api:character_collection')
+SLOTS = (
+    'body',
+    'bracelet',
+    'earrings',
+    'feet',
+    'hands',
+    'head',
+    'left_ring',
+    'legs',
+    'mainhand',
+    'necklace',
+    'offhand',
+    'right_ring',
+)
+
+
+def _bis_fields(bis_gear: Gear, curr_gear: Gear) -> Dict[str, Gear]:
+    """
+    Build the kwargs for every gear slot of a BISList, using the same Gear for every bis slot and every current slot
+    """
+    return {
+        **{f'bis_{slot}': bis_gear for slot in SLOTS},
+        **{f'current_{slot}': curr_gear for slot in SLOTS},
+    }
+
+
+def _make_bis_list(owner: Character, job_id: str, bis_gear: Gear, curr_gear: Gear) -> BISList:
+    """
+    Create a BISList for the given Character
+    """
+    return BISList.objects.create(**_bis_fields(bis_gear, curr_gear), job_id=job_id, owner=owner)
+
 
 def _fake_task(pk: int):
     """
     Handle what celery would handle if it were running
     """
     try:
-        obj = Character.objects.get(pk=pk)
+        obj = Character.objects.select_related('user', 'user__settings').get(pk=pk)
     except Character.DoesNotExist:  # pragma: no cover
         return
     if not obj.verified:
@@ -28,23 +62,34 @@ def _fake_task(pk: int):
         notifier.verify_fail(obj, 'Already Verified!')
 
 
-class CharacterCollection(SavageAimTestCase):
+class SeededCharacterTestCase(SavageAimTestCase):
     """
-    Test the list and create methods
+    Superclass for tests that need the static seed data to build BISLists and Teams.
+    Seed data is loaded once per class, and each test's own rows are rolled back after it runs.
     """
 
-    def tearDown(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Clean up the DB after each test
+        Seed the static data and look up the rows the tests build on
         """
-        Character.objects.all().delete()
+        call_command('seed', stdout=StringIO())
+        cls.bis_gear = Gear.objects.first()
+        cls.curr_gear = Gear.objects.last()
+        cls.tier = Tier.objects.first()
+
+
+class CharacterCollection(SavageAimTestCase):
+    """
+    Test the list and create methods
+    """
 
     def test_list(self):
         """
         Create a couple of characters for a user and send a list request for them
         ensure the data is returned as expected
         """
-        url = reverse('api:character_collection')
+        url = COLLECTION_URL
         user = self._get_user()
         self.client.force_authenticate(user)
 
@@ -65,20 +110,21 @@ class CharacterCollection(SavageAimTestCase):
             world='Shiva',
         )
 
-        response = self.client.get(url)
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
         content = response.json()
         self.assertEqual(len(content), 2)
-        self.assertDictEqual(content[0], CharacterCollectionSerializer(char1).data)
-        self.assertDictEqual(content[1], CharacterCollectionSerializer(char2).data)
+        self.assertEqual(content, CharacterCollectionSerializer([char1, char2], many=True).data)
 
     def test_create(self):
         """
         Create a new character using the API request.
         Ensure that the record is created, and the returned token equals the one in the database
         """
-        url = reverse('api:character_collection')
-        self.client.force_authenticate(self._get_user())
+        url = COLLECTION_URL
+        user = self._get_user()
+        self.client.force_authenticate(user)
         data = {
             'avatar_url': 'https://img.savageaim.com/test123',
             'lodestone_id': '3412557245',
@@ -88,17 +134,16 @@ class CharacterCollection(SavageAimTestCase):
         response = self.client.post(url, data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
         self.assertEqual(Character.objects.count(), 1)
-        char = Character.objects.first()
-        data['id'] = char.pk
+        char_id = response.json()['id']
+        char = Character.objects.select_related('user').get(pk=char_id)
+        data['id'] = char_id
         data['verified'] = False
-        data['user_id'] = self._get_user().id
+        data['user_id'] = user.id
         data['alias'] = ''
         data['proxy'] = False
         data['bis_lists'] = []
         obj_data = CharacterCollectionSerializer(char).data
         self.assertDictEqual(data, obj_data)
-
-        self.assertEqual(response.json()['id'], char.pk)
         char.delete()
 
         # Test with the new form of world text we're getting from lodestone and ensure my fix works
@@ -111,7 +156,7 @@ class CharacterCollection(SavageAimTestCase):
         response = self.client.post(url, data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
         self.assertEqual(Character.objects.count(), 1)
-        char = Character.objects.first()
+        char = Character.objects.get(pk=response.json()['id'])
         self.assertEqual(char.world, 'Lich (Light)')
 
     def test_create_400(self):
@@ -123,8 +168,9 @@ class CharacterCollection(SavageAimTestCase):
             - Create request for an existing lodestone id
             - omitting some data
         """
-        url = reverse('api:character_collection')
-        self.client.force_authenticate(self._get_user())
+        url = COLLECTION_URL
+        user = self._get_user()
+        self.client.force_authenticate(user)
 
         # Omit all data and ensure request fails
         response = self.client.post(url)
@@ -138,7 +184,7 @@ class CharacterCollection(SavageAimTestCase):
         char = Character.objects.create(
             avatar_url='https://img.savageaim.com/abcde',
             lodestone_id=1234567890,
-            user=self._get_user(),
+            user=user,
             name='Char 1',
             world='Lich',
             verified=True,
@@ -154,7 +200,7 @@ class CharacterCollection(SavageAimTestCase):
         self.assertEqual(errors['lodestone_id'], ['A verified character with this Lodestone ID already exists.'])
 
 
-class CharacterResource(SavageAimTestCase):
+class CharacterResource(SeededCharacterTestCase):
     """
     Test the resource methods, read and update, for correct action
     """
@@ -163,69 +209,34 @@ class CharacterResource(SavageAimTestCase):
         """
         Create user and BIS List
         """
-        # Call management commands for the bislist
-        call_command('seed', stdout=StringIO())
+        user = self._get_user()
+        self.client.force_authenticate(user)
 
         # Create some users, then send a list request and check the data returned is correct
         self.char = Character.objects.create(
             avatar_url='https://img.savageaim.com/abcde',
             lodestone_id=1234567890,
-            user=self._get_user(),
+            user=user,
             name='Char 1',
             world='Lich',
             verified=False,
         )
         # Create a bislist for the character as well
-        bis_gear = Gear.objects.first()
-        curr_gear = Gear.objects.last()
-        BISList.objects.create(
-            bis_body=bis_gear,
-            bis_bracelet=bis_gear,
-            bis_earrings=bis_gear,
-            bis_feet=bis_gear,
-            bis_hands=bis_gear,
-            bis_head=bis_gear,
-            bis_left_ring=bis_gear,
-            bis_legs=bis_gear,
-            bis_mainhand=bis_gear,
-            bis_necklace=bis_gear,
-            bis_offhand=bis_gear,
-            bis_right_ring=bis_gear,
-            current_body=curr_gear,
-            current_bracelet=curr_gear,
-            current_earrings=curr_gear,
-            current_feet=curr_gear,
-            current_hands=curr_gear,
-            current_head=curr_gear,
-            current_left_ring=curr_gear,
-            current_legs=curr_gear,
-            current_mainhand=curr_gear,
-            current_necklace=curr_gear,
-            current_offhand=curr_gear,
-            current_right_ring=curr_gear,
-            job=Job.objects.get(pk='DRG'),
-            owner=self.char,
-        )
-
-    def tearDown(self):
-        """
-        Clean up the DB after each test
-        """
-        Character.objects.all().delete()
+        _make_bis_list(self.char, 'DRG', self.bis_gear, self.curr_gear)
 
     def test_read(self):
         """
         Create a couple of characters for a user and send a list request for them
         ensure the data is returned as expected
         """
-        user = self._get_user()
-        self.client.force_authenticate(user)
         url = reverse('api:character_resource', kwargs={'pk': self.char.id})
 
-        response = self.client.get(url)
+        with self.assertNumQueries(27):
+            response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
         content = response.json()
-        self.assertDictEqual(content, CharacterDetailsSerializer(self.char).data)
+        expected = CharacterDetailsSerializer(Character.objects.with_details().get(pk=self.char.pk)).data
+        self.assertDictEqual(content, expected)
         self.assertIn('bis_lists', content)
         self.assertEqual(len(content['bis_lists']), 1)
 
@@ -233,8 +244,6 @@ class CharacterResource(SavageAimTestCase):
         """
         Test the update of a character's fields that can be updated
         """
-        user = self._get_user()
-        self.client.force_authenticate(user)
         url = reverse('api:character_resource', kwargs={'pk': self.char.id})
 
         data = {
@@ -259,8 +268,6 @@ class CharacterResource(SavageAimTestCase):
         - name longer than 60 characters
         - world longer than 60 characters
         """
-        user = self._get_user()
-        self.client.force_authenticate(user)
         url = reverse('api:character_resource', kwargs={'pk': self.char.id})
 
         data = {
@@ -296,9 +303,6 @@ class CharacterResource(SavageAimTestCase):
         - ID doesn't exist
         - Character doesn't belong to specified User
         """
-        user = self._get_user()
-        self.client.force_authenticate(user)
-
         # ID doesn't exist
         url = reverse('api:character_resource', kwargs={'pk': 0000000000000000000000})
         response = self.client.get(url)
@@ -326,15 +330,23 @@ class CharacterVerification(SavageAimTestCase):
     Test that the verification view works as intended
     """
 
-    def tearDown(self):
+    @classmethod
+    def setUpClass(cls):
+        """
+        Replace the celery task with _fake_task once for the whole class
+        """
+        super().setUpClass()
+        patcher = patch('api.views.character.verify_character.delay', side_effect=_fake_task)
+        cls.mocked_task = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    def setUp(self):
         """
-        Clean up the DB after each test
+        Clear the calls recorded on the mocked task by previous tests
         """
-        Notification.objects.all().delete()
-        Character.objects.all().delete()
+        self.mocked_task.reset_mock()
 
-    @patch('api.views.character.verify_character.delay', side_effect=_fake_task)
-    def test_verify(self, mocked_task):
+    def test_verify(self):
         """
         Create a couple of characters for a user and send a list request for them
         ensure the data is returned as expected
@@ -359,15 +371,21 @@ class CharacterVerification(SavageAimTestCase):
         self.assertTrue(char.verified)
 
         # Do some testing of the mocked task information
-        mocked_task.assert_called()
+        self.mocked_task.assert_called()
 
         # Check Notifications
-        self.assertEqual(Notification.objects.filter(user=user).count(), 1)
-        notif = Notification.objects.filter(user=user).first()
-        self.assertEqual(notif.link, f'/characters/{char.id}/')
-        self.assertEqual(notif.text, f'The verification of {char} has succeeded!')
-        self.assertEqual(notif.type, 'verify_success')
-        self.assertFalse(notif.read)
+        notifs = list(Notification.objects.filter(user=user))
+        self.assertEqual(len(notifs), 1)
+        notif = notifs[0]
+        self.assertDictEqual(
+            {'link': notif.link, 'text': notif.text, 'type': notif.type, 'read': notif.read},
+            {
+                'link': f'/characters/{char.id}/',
+                'text': f'The verification of {char} has succeeded!',
+                'type': 'verify_success',
+                'read': False,
+            },
+        )
 
     def test_verify_fail_notifs(self):
         """
@@ -386,20 +404,25 @@ class CharacterVerification(SavageAimTestCase):
         _fake_task(char.id)
 
         # Check Notification was created properly
-        self.assertEqual(Notification.objects.filter(user=user).count(), 1)
-        notif = Notification.objects.filter(user=user).first()
-        self.assertEqual(notif.link, f'/characters/{char.id}/')
-        self.assertEqual(notif.text, f'The verification of {char} has failed! Reason: Already Verified!')
-        self.assertEqual(notif.type, 'verify_fail')
-        self.assertFalse(notif.read)
+        notifs = list(Notification.objects.filter(user=user))
+        self.assertEqual(len(notifs), 1)
+        notif = notifs[0]
+        self.assertDictEqual(
+            {'link': notif.link, 'text': notif.text, 'type': notif.type, 'read': notif.read},
+            {
+                'link': f'/characters/{char.id}/',
+                'text': f'The verification of {char} has failed! Reason: Already Verified!',
+                'type': 'verify_fail',
+                'read': False,
+            },
+        )
 
         # Update settings and try again
         Settings.objects.create(user=user, theme='beta', notifications={'verify_fail': False})
         _fake_task(char.id)
         self.assertEqual(Notification.objects.filter(user=user).count(), 1)
 
-    @patch('api.views.character.verify_character.delay', side_effect=_fake_task)
-    def test_404(self, mocked_task):
+    def test_404(self):
         """
         Test the cases that cause a 404 to be returned;
 
@@ -428,17 +451,15 @@ class CharacterVerification(SavageAimTestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, response.content)
 
         # Character is already verified
-        char.verified = True
-        char.user = user
-        char.save()
+        Character.objects.filter(pk=char.pk).update(verified=True, user=user)
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, response.content)
 
         # Make sure the celery task was never called
-        mocked_task.assert_not_called()
+        self.mocked_task.assert_not_called()
 
 
-class CharacterDelete(SavageAimTestCase):
+class CharacterDelete(SeededCharacterTestCase):
     """
     Test the methods in the Delete view for correct logic
     """
@@ -447,128 +468,55 @@ class CharacterDelete(SavageAimTestCase):
         """
         Create necessary models
         """
-        Notification.objects.all().delete()
-        # Call management commands for the bislist
-        call_command('seed', stdout=StringIO())
-
-        # Create some users, then send a list request and check the data returned is correct
-        self.char = Character.objects.create(
-            avatar_url='https://img.savageaim.com/abcde',
-            lodestone_id=1234567890,
-            user=self._get_user(),
-            name='Char 1',
-            world='Lich',
-            verified=False,
-        )
-        # Create a bislist for the character as well
-        bis_gear = Gear.objects.first()
-        curr_gear = Gear.objects.last()
-        self.bis = BISList.objects.create(
-            bis_body=bis_gear,
-            bis_bracelet=bis_gear,
-            bis_earrings=bis_gear,
-            bis_feet=bis_gear,
-            bis_hands=bis_gear,
-            bis_head=bis_gear,
-            bis_left_ring=bis_gear,
-            bis_legs=bis_gear,
-            bis_mainhand=bis_gear,
-            bis_necklace=bis_gear,
-            bis_offhand=bis_gear,
-            bis_right_ring=bis_gear,
-            current_body=curr_gear,
-            current_bracelet=curr_gear,
-            current_earrings=curr_gear,
-            current_feet=curr_gear,
-            current_hands=curr_gear,
-            current_head=curr_gear,
-            current_left_ring=curr_gear,
-            current_legs=curr_gear,
-            current_mainhand=curr_gear,
-            current_necklace=curr_gear,
-            current_offhand=curr_gear,
-            current_right_ring=curr_gear,
-            job=Job.objects.get(pk='DRG'),
-            owner=self.char,
-        )
-
-        # Create some extra data for proper testing
-        self.other_char = Character.objects.create(
-            avatar_url='https://img.savageaim.com/vwxyz',
-            lodestone_id=987654321,
-            user=self._create_user(),
-            name='Char 2',
-            world='Lich',
-            verified=True,
-        )
-        self.other_bis = BISList.objects.create(
-            bis_body=bis_gear,
-            bis_bracelet=bis_gear,
-            bis_earrings=bis_gear,
-            bis_feet=bis_gear,
-            bis_hands=bis_gear,
-            bis_head=bis_gear,
-            bis_left_ring=bis_gear,
-            bis_legs=bis_gear,
-            bis_mainhand=bis_gear,
-            bis_necklace=bis_gear,
-            bis_offhand=bis_gear,
-            bis_right_ring=bis_gear,
-            current_body=curr_gear,
-            current_bracelet=curr_gear,
-            current_earrings=curr_gear,
-            current_feet=curr_gear,
-            current_hands=curr_gear,
-            current_head=curr_gear,
-            current_left_ring=curr_gear,
-            current_legs=curr_gear,
-            current_mainhand=curr_gear,
-            current_necklace=curr_gear,
-            current_offhand=curr_gear,
-            current_right_ring=curr_gear,
-            job=Job.objects.get(pk='PLD'),
-            owner=self.other_char,
-        )
-
-        self.solo_team = Team.objects.create(
-            invite_code=Team.generate_invite_code(),
-            name='One Man Team',
-            tier=Tier.objects.first(),
-        )
-        self.my_team = Team.objects.create(
-            invite_code=Team.generate_invite_code(),
-            name='My Team',
-            tier=Tier.objects.first(),
-        )
-        self.your_team = Team.objects.create(
-            invite_code=Team.generate_invite_code(),
-            name='Your Team',
-            tier=Tier.objects.first(),
-        )
-
-        self.solo_team.members.create(character=self.char, bis_list=self.bis, lead=True)
-        self.my_team.members.create(character=self.char, bis_list=self.bis, lead=True)
-        self.your_team.members.create(character=self.char, bis_list=self.bis, lead=False)
-        self.my_team.members.create(character=self.other_char, bis_list=self.other_bis, lead=False)
-        self.your_team.members.create(character=self.other_char, bis_list=self.other_bis, lead=True)
+        user = self._get_user()
+        self.client.force_authenticate(user)
 
-    def tearDown(self):
-        """
-        Clean up the DB after each test
-        """
-        Team.objects.all().delete()
-        Character.objects.all().delete()
+        # Create the Character under test alongside another one to share its Teams, in a single INSERT
+        self.char, self.other_char = Character.objects.bulk_create([
+            Character(
+                avatar_url='https://img.savageaim.com/abcde',
+                lodestone_id=1234567890,
+                user=user,
+                name='Char 1',
+                world='Lich',
+                verified=False,
+            ),
+            Character(
+                avatar_url='https://img.savageaim.com/vwxyz',
+                lodestone_id=987654321,
+                user=self._create_user(),
+                name='Char 2',
+                world='Lich',
+                verified=True,
+            ),
+        ])
+
+        # Create a bislist for each character as well
+        self.bis = _make_bis_list(self.char, 'DRG', self.bis_gear, self.curr_gear)
+        self.other_bis = _make_bis_list(self.other_char, 'PLD', self.bis_gear, self.curr_gear)
+
+        self.solo_team, self.my_team, self.your_team = Team.objects.bulk_create([
+            Team(invite_code=Team.generate_invite_code(), name='One Man Team', tier=self.tier),
+            Team(invite_code=Team.generate_invite_code(), name='My Team', tier=self.tier),
+            Team(invite_code=Team.generate_invite_code(), name='Your Team', tier=self.tier),
+        ])
+
+        TeamMember.objects.bulk_create([
+            TeamMember(team=self.solo_team, character=self.char, bis_list=self.bis, lead=True),
+            TeamMember(team=self.my_team, character=self.char, bis_list=self.bis, lead=True),
+            TeamMember(team=self.your_team, character=self.char, bis_list=self.bis, lead=False),
+            TeamMember(team=self.my_team, character=self.other_char, bis_list=self.other_bis, lead=False),
+            TeamMember(team=self.your_team, character=self.other_char, bis_list=self.other_bis, lead=True),
+        ])
 
     def test_read(self):
         """
         Create a couple of characters for a user and send a list request for them
         ensure the data is returned as expected
         """
-        user = self._get_user()
-        self.client.force_authenticate(user)
-
         url = reverse('api:character_delete', kwargs={'pk': self.char.id})
-        response = self.client.get(url)
+        with self.assertNumQueries(35):
+            response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
         content = response.json()
         expected = {
@@ -589,15 +537,12 @@ class CharacterDelete(SavageAimTestCase):
             },
         }
 
-        for entry in content:
-            self.assertDictEqual(entry, expected[entry['name']])
+        self.assertDictEqual({entry['name']: entry for entry in content}, expected)
 
     def test_delete(self):
         """
         Delete a character and check that all information as expected has been updated
         """
-        user = self._get_user()
-        self.client.force_authenticate(user)
         url = reverse('api:character_delete', kwargs={'pk': self.char.id})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
@@ -643,9 +588,6 @@ class CharacterDelete(SavageAimTestCase):
         - ID doesn't exist
         - Character doesn't belong to specified User
         """
-        user = self._get_user()
-        self.client.force_authenticate(user)
-
         # ID doesn't exist
         url = reverse('api:character_delete', kwargs={'pk': 0000000000000000000000})
         response = self.client.get(url)